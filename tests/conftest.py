@@ -0,0 +1,21 @@
+"""
+Shared fixtures for the TokenTrackTUI test suite.
+"""
+
+from typing import Any, Dict
+
+import pytest
+
+from tokentracktui.core.config import Config
+
+
+@pytest.fixture(scope="session")
+def _default_config_template() -> Dict[str, Any]:
+    """Plain-dict form of the default Config, built once per session."""
+    return Config().model_dump()
+
+
+@pytest.fixture
+def default_config(_default_config_template) -> Config:
+    """Fresh default Config validated from the session template."""
+    return Config.model_validate(_default_config_template)
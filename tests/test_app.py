@@ -4,7 +4,7 @@ Tests for the main application functionality.
 
 import pytest
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from pathlib import Path
 
 from tokentracktui.core.app import TokenTrackTUIApp, create_app
@@ -39,13 +39,14 @@ class TestTokenTrackTUIApp:
 class TestAppBehavior:
     """Test application behavior and lifecycle."""
     
+    @pytest.mark.benchmark
     async def test_app_startup_performance(self):
         """Test that app creation meets performance targets."""
-        start_time = time.time()
+        start = time.perf_counter()
         
         app = create_app()
         
-        creation_time = time.time() - start_time
+        creation_time = time.perf_counter() - start
         
         # Should meet the Phase 1 target of <500ms for app creation
         assert creation_time < 0.5, f"App creation took {creation_time:.3f}s, expected <0.5s"
@@ -54,41 +55,48 @@ class TestAppBehavior:
 class TestAppConfiguration:
     """Test app configuration handling."""
     
-    @patch('tokentracktui.core.app.setup_logging')
-    def test_logging_setup_called(self, mock_setup_logging):
+    def test_logging_setup_called(self, monkeypatch):
         """Test that logging setup is called during app initialization."""
+        calls = []
+        monkeypatch.setattr(
+            'tokentracktui.core.app.setup_logging',
+            lambda *args, **kwargs: calls.append((args, kwargs)),
+        )
         app = create_app(log_level="DEBUG")
         
         # The logging setup should be called when the app mounts
         # Since we can't easily test the mount process, we'll test the setup method
         app._setup_logging()
         
-        mock_setup_logging.assert_called_once()
+        assert len(calls) == 1
     
-    def test_app_loads_default_config(self, tmp_path):
+    def test_app_loads_default_config(self, tmp_path, monkeypatch):
         """Test that app loads default configuration when none exists."""
         app = create_app(config_dir=tmp_path)
         
-        # Mock the config loading to test the behavior
-        with patch.object(app.config_manager, 'load_config') as mock_load:
-            mock_config = Config(providers=[
-                ProviderConfig(name="Mock", type="mock")
-            ])
-            mock_load.return_value = mock_config
-            
-            # This would normally be called during mount
-            config = app.config_manager.load_config()
-            
-            assert isinstance(config, Config)
-            assert len(config.providers) == 1
-            assert config.providers[0].type == "mock"
+        # Stub the config loading to test the behavior
+        mock_config = Config(providers=[
+            ProviderConfig(name="Mock", type="mock")
+        ])
+        monkeypatch.setattr(app.config_manager, 'load_config', lambda: mock_config)
+        
+        # This would normally be called during mount
+        config = app.config_manager.load_config()
+        
+        assert isinstance(config, Config)
+        assert len(config.providers) == 1
+        assert config.providers[0].type == "mock"
+
+
+# Public attribute names of the app, computed once instead of per Mock(spec=...)
+_APP_SPEC = [name for name in dir(TokenTrackTUIApp) if not name.startswith('_')]
 
 
 @pytest.fixture
-def mock_app():
+def mock_app(default_config):
     """Create a mock application for testing."""
-    app = Mock(spec=TokenTrackTUIApp)
-    app.config = Config()
+    app = Mock(spec=_APP_SPEC)
+    app.config = default_config
     app.log_level = "INFO"
     return app
 
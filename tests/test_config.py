@@ -2,12 +2,19 @@
 Tests for configuration management functionality.
 """
 
+import hashlib
+import math
+import os
+import pickle
+import sys
 import pytest
-import tempfile
-import toml
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict
 
+from pydantic import ValidationError
+
+from tokentracktui.core import config as config_module
 from tokentracktui.core.config import (
     Config,
     ConfigManager,
@@ -18,6 +25,24 @@ from tokentracktui.core.config import (
 )
 
 
+@pytest.fixture(scope="module")
+def default_provider_config() -> ProviderConfig:
+    """ProviderConfig with only the required fields set."""
+    return ProviderConfig(name="Test", type="mock")
+
+
+@pytest.fixture(scope="module")
+def default_ui_config() -> UIConfig:
+    """UIConfig built from defaults."""
+    return UIConfig()
+
+
+@pytest.fixture(scope="module")
+def default_app_config() -> AppConfig:
+    """AppConfig built from defaults."""
+    return AppConfig()
+
+
 class TestProviderConfig:
     """Test ProviderConfig model."""
     
@@ -37,16 +62,17 @@ class TestProviderConfig:
         assert config.credentials == {"api_key": "test"}
         assert config.settings == {"test": True}
     
-    def test_provider_defaults(self):
+    @pytest.mark.parametrize("field,expected", [
+        ("enabled", True),
+        ("credentials", {}),
+        ("settings", {}),
+    ])
+    def test_provider_defaults(self, default_provider_config, field, expected):
         """Test provider configuration defaults."""
-        config = ProviderConfig(
-            name="Test",
-            type="mock"
-        )
+        value = getattr(default_provider_config, field)
         
-        assert config.enabled is True
-        assert config.credentials == {}
-        assert config.settings == {}
+        assert value == expected
+        assert type(value) is type(expected)
     
     def test_unknown_provider_type_warning(self, caplog):
         """Test warning for unknown provider types."""
@@ -62,31 +88,39 @@ class TestProviderConfig:
 class TestUIConfig:
     """Test UIConfig model."""
     
-    def test_default_ui_config(self):
+    @pytest.mark.parametrize("field,expected", [
+        ("theme", "neural-nexus"),
+        ("terminal_width_min", 80),
+        ("terminal_width_optimal", 120),
+        ("refresh_interval", 30),
+        ("animations_enabled", True),
+        ("unicode_enabled", True),
+        ("color_mode", "auto"),
+    ])
+    def test_default_ui_config(self, default_ui_config, field, expected):
         """Test default UI configuration values."""
-        config = UIConfig()
-        
-        assert config.theme == "neural-nexus"
-        assert config.terminal_width_min == 80
-        assert config.terminal_width_optimal == 120
-        assert config.refresh_interval == 30
-        assert config.animations_enabled is True
-        assert config.unicode_enabled is True
-        assert config.color_mode == "auto"
+        value = getattr(default_ui_config, field)
+        
+        assert value == expected
+        assert type(value) is type(expected)
 
 
 class TestAppConfig:
     """Test AppConfig model."""
     
-    def test_default_app_config(self):
+    @pytest.mark.parametrize("field,expected", [
+        ("log_level", "INFO"),
+        ("log_file", None),
+        ("cache_ttl", 3600),
+        ("data_retention_days", 90),
+        ("dry_run_mode", False),
+    ])
+    def test_default_app_config(self, default_app_config, field, expected):
         """Test default application configuration values."""
-        config = AppConfig()
+        value = getattr(default_app_config, field)
         
-        assert config.log_level == "INFO"
-        assert config.log_file is None
-        assert config.cache_ttl == 3600
-        assert config.data_retention_days == 90
-        assert config.dry_run_mode is False
+        assert value == expected
+        assert type(value) is type(expected)
 
 
 class TestConfig:
@@ -108,19 +142,42 @@ class TestConfig:
         
         assert len(config.providers) == 1
         assert config.providers[0].name == "Test"
+    
+    def test_config_is_immutable(self, default_config):
+        """Test configuration models reject attribute assignment."""
+        with pytest.raises(ValidationError):
+            default_config.version = "2.0.0"
+        with pytest.raises(ValidationError):
+            default_config.ui.theme = "other"
+
+
+@pytest.fixture(scope="module")
+def shared_config_dir(tmp_path_factory) -> Path:
+    """Config directory shared by tests that never write to it."""
+    return tmp_path_factory.mktemp("shared-cfg")
+
+
+@pytest.fixture(scope="module")
+def shared_manager(shared_config_dir) -> ConfigManager:
+    """ConfigManager shared by read-only tests."""
+    return ConfigManager(shared_config_dir)
+
+
+@pytest.fixture
+def manager_factory(tmp_path_factory) -> Callable[[], ConfigManager]:
+    """Factory producing ConfigManagers backed by fresh, empty directories."""
+    def factory() -> ConfigManager:
+        return ConfigManager(tmp_path_factory.mktemp("cfg"))
+    return factory
 
 
 class TestConfigManager:
     """Test ConfigManager functionality."""
     
-    def test_init_with_custom_dir(self):
+    def test_init_with_custom_dir(self, shared_config_dir, shared_manager):
         """Test initialization with custom config directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir)
-            manager = ConfigManager(config_dir)
-            
-            assert manager.config_dir == config_dir
-            assert manager.config_file == config_dir / "tokentracktui_config.toml"
+        assert shared_manager.config_dir == shared_config_dir
+        assert shared_manager.config_file == shared_config_dir / "tokentracktui_config.toml"
     
     def test_init_with_default_dir(self):
         """Test initialization with default config directory."""
@@ -129,144 +186,359 @@ class TestConfigManager:
         assert manager.config_dir.name == "tokentracktui"
         assert "tokentracktui_config.toml" in str(manager.config_file)
     
-    def test_create_default_config(self):
-        """Test creating default configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager = ConfigManager(Path(temp_dir))
-            config = manager._create_default_config()
+    def test_default_dir_follows_environment(self, tmp_path, monkeypatch):
+        """Test the default directory honours later environment changes."""
+        variable = 'APPDATA' if os.name == 'nt' else 'XDG_CONFIG_HOME'
+        for name in ("first", "second"):
+            monkeypatch.setenv(variable, str(tmp_path / name))
             
-            assert isinstance(config, Config)
-            assert len(config.providers) == 1
-            assert config.providers[0].type == "mock"
-            assert config.providers[0].name == "Mock Provider"
+            assert ConfigManager().config_dir == tmp_path / name / "tokentracktui"
     
-    def test_load_config_creates_default_if_missing(self):
-        """Test loading config creates default when file doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager = ConfigManager(Path(temp_dir))
-            
-            # Config file shouldn't exist initially
-            assert not manager.config_file.exists()
-            
-            # Loading should create default config
-            config = manager.load_config()
+    def test_default_dir_skips_home_lookup(self, tmp_path, monkeypatch):
+        """Test the home directory is not resolved when the variable is set."""
+        def no_home():
+            raise RuntimeError("Could not determine home directory")
+        
+        monkeypatch.setattr(Path, "home", no_home)
+        monkeypatch.setenv('APPDATA' if os.name == 'nt' else 'XDG_CONFIG_HOME', str(tmp_path))
+        
+        assert config_module._default_config_dir() == tmp_path / "tokentracktui"
+    
+    def test_default_dir_follows_home_when_unset(self, tmp_path, monkeypatch):
+        """Test the cached fallback directory follows the home directory."""
+        monkeypatch.delenv('APPDATA' if os.name == 'nt' else 'XDG_CONFIG_HOME', raising=False)
+        for name in ("first", "second"):
+            monkeypatch.setenv('USERPROFILE' if os.name == 'nt' else 'HOME', str(tmp_path / name))
             
-            assert isinstance(config, Config)
-            assert manager.config_file.exists()
-            assert len(config.providers) == 1
+            assert str(config_module._default_config_dir()).startswith(str(tmp_path / name))
+    
+    def test_save_recreates_deleted_dir(self, manager_factory):
+        """Test a new manager recreates a directory removed after first use."""
+        config_dir = manager_factory().config_dir
+        config_dir.rmdir()
+        
+        manager = ConfigManager(config_dir)
+        manager.load_config()
+        manager.save_config()
+        
+        assert manager.config_file.exists()
+    
+    def test_create_default_config(self, shared_manager):
+        """Test creating default configuration."""
+        config = shared_manager._create_default_config()
+        
+        assert isinstance(config, Config)
+        assert len(config.providers) == 1
+        assert config.providers[0].type == "mock"
+        assert config.providers[0].name == "Mock Provider"
     
-    def test_save_and_load_config(self):
+    def test_default_configs_do_not_share_state(self, shared_manager):
+        """Test each default config gets its own provider settings."""
+        first = shared_manager._create_default_config()
+        first.providers[0].settings["data_points"] = 1
+        
+        second = shared_manager._create_default_config()
+        assert second.providers[0].settings["data_points"] == 100
+    
+    def test_load_config_creates_default_if_missing(self, manager_factory):
+        """Test loading config creates default when file doesn't exist."""
+        manager = manager_factory()
+        
+        # Config file shouldn't exist initially
+        assert not manager.config_file.exists()
+        
+        # Loading should return the default config without writing it
+        config = manager.load_config()
+        
+        assert isinstance(config, Config)
+        assert not manager.config_file.exists()
+        assert len(config.providers) == 1
+        
+        manager.ensure_persisted()
+        assert manager.config_file.exists()
+    
+    def test_mutation_persists_pending_default(self, manager_factory):
+        """Test the unsaved default is written before the first mutation."""
+        manager = manager_factory()
+        manager.load_config()
+        
+        manager.add_provider(ProviderConfig(name="New Provider", type="openai"))
+        
+        assert manager.config_file.exists()
+        on_disk = ConfigManager(manager.config_dir).load_config()
+        assert [p.name for p in on_disk.providers] == ["Mock Provider"]
+    
+    def test_save_and_load_config(self, manager_factory):
         """Test saving and loading configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager = ConfigManager(Path(temp_dir))
-            
-            # Create and save a custom config
-            provider = ProviderConfig(
-                name="Custom Provider",
-                type="gcp",
-                settings={"project_id": "test-project"}
-            )
-            config = Config(providers=[provider])
-            manager._config = config
-            manager.save_config()
-            
-            # Load the config back
-            loaded_config = manager.load_config()
+        manager = manager_factory()
+        
+        # Create and save a custom config
+        provider = ProviderConfig(
+            name="Custom Provider",
+            type="gcp",
+            settings={"project_id": "test-project"}
+        )
+        config = Config(providers=[provider])
+        manager._config = config
+        manager.save_config()
+        
+        # Load the config back
+        loaded_config = manager.load_config()
+        
+        assert len(loaded_config.providers) == 1
+        assert loaded_config.providers[0].name == "Custom Provider"
+        assert loaded_config.providers[0].type == "gcp"
+        assert loaded_config.providers[0].settings["project_id"] == "test-project"
+    
+    def test_load_config_uses_parse_cache(self, manager_factory):
+        """Test a valid parse cache is used instead of the TOML source."""
+        manager = manager_factory()
+        manager.ensure_persisted()
+        
+        assert manager.cache_file.exists()
+        
+        # Stamp a marker into the cached data without touching the TOML
+        toml_bytes = manager.config_file.read_bytes()
+        manager._write_cache(toml_bytes, Config(version="cached"))
+        
+        # Forget the in-process copy so the on-disk cache is consulted
+        config_module._CONFIG_CACHE.clear()
+        assert ConfigManager(manager.config_dir).load_config().version == "cached"
+    
+    def test_load_config_reuses_loaded_config(self, manager_factory, monkeypatch):
+        """Test repeated loads of an unchanged file skip reading it again."""
+        manager = manager_factory()
+        manager.ensure_persisted()
+        
+        first = ConfigManager(manager.config_dir).load_config()
+        
+        def fail_read(self, toml_bytes):
+            raise AssertionError("unchanged config was read again")
+        
+        monkeypatch.setattr(ConfigManager, "_read_cache", fail_read)
+        assert ConfigManager(manager.config_dir).load_config() == first
+        
+        monkeypatch.undo()
+        with open(manager.config_file, 'a') as f:
+            f.write("\n# edited\n")
+        
+        assert ConfigManager(manager.config_dir).load_config() is not first
+    
+    def test_cached_configs_do_not_share_state(self, manager_factory):
+        """Test managers of one file cannot see each other's nested edits."""
+        manager = manager_factory()
+        manager.ensure_persisted()
+        
+        a = ConfigManager(manager.config_dir)
+        b = ConfigManager(manager.config_dir)
+        a.load_config().providers[0].settings["data_points"] = 1
+        
+        assert b.load_config().providers[0].settings["data_points"] == 100
+        assert ConfigManager(manager.config_dir).load_config().providers[0].settings["data_points"] == 100
+        
+        # A saved config is cached as a copy too
+        a.save_config()
+        a._config.providers[0].settings["data_points"] = 2
+        assert ConfigManager(manager.config_dir).load_config().providers[0].settings["data_points"] == 1
+    
+    def test_parse_cache_invalidated_by_edit(self, manager_factory):
+        """Test editing the TOML file invalidates the parse cache."""
+        manager = manager_factory()
+        manager.ensure_persisted()
+        manager._write_cache(manager.config_file.read_bytes(), Config(version="cached"))
+        
+        with open(manager.config_file, 'a') as f:
+            f.write("\n# edited\n")
+        
+        assert ConfigManager(manager.config_dir).load_config().version == "1.0.0"
+    
+    def test_parse_cache_rejects_stale_schema(self, manager_factory):
+        """Test a cache written against other models falls back to the TOML."""
+        manager = manager_factory()
+        manager.ensure_persisted()
+        checksum = hashlib.sha256(manager.config_file.read_bytes()).digest()
+        
+        # A pickled model from an older release, lacking a field of AppConfig
+        stale = Config(version="cached")
+        del stale.app.__dict__["log_level"]
+        stale_payloads = [
+            (checksum, stale),
+            (checksum, {"version": "cached", "providers": "not a list"}),
+        ]
+        for payload in stale_payloads:
+            manager.cache_file.write_bytes(pickle.dumps(payload))
+            config_module._CONFIG_CACHE.clear()
             
-            assert len(loaded_config.providers) == 1
-            assert loaded_config.providers[0].name == "Custom Provider"
-            assert loaded_config.providers[0].type == "gcp"
-            assert loaded_config.providers[0].settings["project_id"] == "test-project"
+            config = ConfigManager(manager.config_dir).load_config()
+            assert config.version == "1.0.0"
+            assert config.app.log_level == "INFO"
     
-    def test_load_invalid_toml_raises_config_error(self):
+    def test_parse_cache_preserves_toml_types(self, manager_factory):
+        """Test datetimes and inf in settings survive the parse cache."""
+        manager = manager_factory()
+        manager.config_file.write_text(
+            '[[providers]]\n'
+            'name = "Typed"\n'
+            'type = "mock"\n'
+            'settings = { billing_start = 2024-01-01T00:00:00, max_budget = inf }\n'
+        )
+        
+        def load_settings() -> Dict[str, Any]:
+            # Skip the in-process copy so the on-disk cache is consulted
+            config_module._CONFIG_CACHE.clear()
+            return ConfigManager(manager.config_dir).load_config().providers[0].settings
+        
+        for _ in range(2):
+            settings = load_settings()
+            assert settings["billing_start"] == datetime(2024, 1, 1)
+            assert settings["max_budget"] == math.inf
+        
+        # Saving a cache-loaded config must not rewrite the values as other types
+        reloaded = ConfigManager(manager.config_dir)
+        reloaded.load_config()
+        reloaded.save_config()
+        settings = load_settings()
+        assert settings["billing_start"] == datetime(2024, 1, 1)
+        assert settings["max_budget"] == math.inf
+
+    def test_load_invalid_toml_raises_config_error(self, manager_factory):
         """Test loading invalid TOML raises ConfigError."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager = ConfigManager(Path(temp_dir))
-            
-            # Write invalid TOML
-            with open(manager.config_file, 'w') as f:
-                f.write("invalid toml [ content")
-            
-            with pytest.raises(ConfigError, match="Invalid TOML syntax"):
-                manager.load_config()
+        manager = manager_factory()
+        
+        # Write invalid TOML
+        with open(manager.config_file, 'w') as f:
+            f.write("invalid toml [ content")
+        
+        with pytest.raises(ConfigError, match="Invalid TOML syntax"):
+            manager.load_config()
     
-    def test_save_config_without_loaded_config_raises_error(self):
+    def test_save_config_without_loaded_config_raises_error(self, manager_factory):
         """Test saving config without loading first raises error."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager = ConfigManager(Path(temp_dir))
-            
-            with pytest.raises(ConfigError, match="No configuration loaded"):
-                manager.save_config()
+        manager = manager_factory()
+        
+        with pytest.raises(ConfigError, match="No configuration loaded"):
+            manager.save_config()
     
-    def test_get_config_loads_if_needed(self):
+    def test_get_config_loads_if_needed(self, manager_factory):
         """Test get_config loads configuration if not already loaded."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager = ConfigManager(Path(temp_dir))
-            
-            assert manager._config is None
-            
-            config = manager.get_config()
-            
-            assert manager._config is not None
-            assert isinstance(config, Config)
+        manager = manager_factory()
+        
+        assert manager._config is None
+        
+        config = manager.get_config()
+        
+        assert manager._config is not None
+        assert isinstance(config, Config)
     
-    def test_add_provider(self):
+    def test_add_provider(self, manager_factory):
         """Test adding a provider configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager = ConfigManager(Path(temp_dir))
-            manager.load_config()  # Load default config
-            
-            initial_count = len(manager._config.providers)
-            
-            new_provider = ProviderConfig(name="New Provider", type="openai")
-            manager.add_provider(new_provider)
-            
-            assert len(manager._config.providers) == initial_count + 1
-            assert manager._config.providers[-1].name == "New Provider"
+        manager = manager_factory()
+        manager.load_config()  # Load default config
+        
+        initial_count = len(manager._config.providers)
+        
+        new_provider = ProviderConfig(name="New Provider", type="openai")
+        manager.add_provider(new_provider)
+        
+        assert len(manager._config.providers) == initial_count + 1
+        assert manager._config.providers[-1].name == "New Provider"
     
-    def test_remove_provider(self):
+    def test_remove_provider(self, manager_factory):
         """Test removing a provider configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager = ConfigManager(Path(temp_dir))
-            
-            # Create config with multiple providers
-            providers = [
-                ProviderConfig(name="Provider 1", type="mock"),
-                ProviderConfig(name="Provider 2", type="gcp"),
-            ]
-            config = Config(providers=providers)
-            manager._config = config
-            
-            # Remove one provider
-            removed = manager.remove_provider("Provider 1")
-            
-            assert removed is True
-            assert len(manager._config.providers) == 1
-            assert manager._config.providers[0].name == "Provider 2"
-            
-            # Try to remove non-existent provider
-            removed = manager.remove_provider("Non-existent")
-            assert removed is False
+        manager = manager_factory()
+        
+        # Create config with multiple providers
+        providers = [
+            ProviderConfig(name="Provider 1", type="mock"),
+            ProviderConfig(name="Provider 2", type="gcp"),
+        ]
+        config = Config(providers=providers)
+        manager._config = config
+        
+        # Remove one provider
+        removed = manager.remove_provider("Provider 1")
+        
+        assert removed is True
+        assert len(manager._config.providers) == 1
+        assert manager._config.providers[0].name == "Provider 2"
+        
+        # Try to remove non-existent provider
+        removed = manager.remove_provider("Non-existent")
+        assert removed is False
+    
+    def test_remove_provider_after_add(self, manager_factory):
+        """Test the provider index tracks added and duplicate providers."""
+        manager = manager_factory()
+        manager._config = Config(providers=[
+            ProviderConfig(name="Dup", type="mock"),
+            ProviderConfig(name="Keep", type="gcp"),
+        ])
+        
+        # Build the index, then add a duplicate name after it exists
+        assert manager.remove_provider("Missing") is False
+        manager.add_provider(ProviderConfig(name="Dup", type="openai"))
+        
+        assert manager.remove_provider("Dup") is True
+        assert [p.name for p in manager._config.providers] == ["Keep"]
     
-    def test_get_enabled_providers(self):
+    def test_get_enabled_providers(self, manager_factory):
         """Test getting enabled providers only."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager = ConfigManager(Path(temp_dir))
-            
-            # Create config with enabled and disabled providers
-            providers = [
-                ProviderConfig(name="Enabled 1", type="mock", enabled=True),
-                ProviderConfig(name="Disabled", type="gcp", enabled=False),
-                ProviderConfig(name="Enabled 2", type="openai", enabled=True),
-            ]
-            config = Config(providers=providers)
-            manager._config = config
-            
-            enabled = manager.get_enabled_providers()
-            
-            assert len(enabled) == 2
-            assert all(p.enabled for p in enabled)
-            assert {p.name for p in enabled} == {"Enabled 1", "Enabled 2"}
+        manager = manager_factory()
+        
+        # Create config with enabled and disabled providers
+        providers = [
+            ProviderConfig(name="Enabled 1", type="mock", enabled=True),
+            ProviderConfig(name="Disabled", type="gcp", enabled=False),
+            ProviderConfig(name="Enabled 2", type="openai", enabled=True),
+        ]
+        config = Config(providers=providers)
+        manager._config = config
+        
+        enabled = manager.get_enabled_providers()
+        
+        assert len(enabled) == 2
+        assert all(p.enabled for p in enabled)
+        assert {p.name for p in enabled} == {"Enabled 1", "Enabled 2"}
+    
+    def test_enabled_providers_refreshed_after_change(self, manager_factory):
+        """Test the cached enabled providers follow provider changes."""
+        manager = manager_factory()
+        manager._config = Config(providers=[ProviderConfig(name="A", type="mock")])
+        
+        assert manager.get_enabled_providers() is manager.get_enabled_providers()
+        
+        manager.add_provider(ProviderConfig(name="B", type="gcp"))
+        assert [p.name for p in manager.get_enabled_providers()] == ["A", "B"]
+        
+        manager.add_provider(ProviderConfig(name="C", type="mock", enabled=False))
+        assert [p.name for p in manager.get_enabled_providers()] == ["A", "B"]
+        
+        manager.remove_provider("A")
+        assert [p.name for p in manager.get_enabled_providers()] == ["B"]
+        assert manager.enabled_provider_count == 1
+        
+        manager.update_config(version="2.0.0")
+        assert [p.name for p in manager.get_enabled_providers()] == ["B"]
+        
+        manager.update_config(providers=[{"name": "D", "type": "mock"}])
+        assert [p.name for p in manager.get_enabled_providers()] == ["D"]
+    
+    def test_update_config(self, manager_factory):
+        """Test updating values keeps the rest of the config intact."""
+        manager = manager_factory()
+        manager._config = Config(
+            providers=[ProviderConfig(name="A", type="mock")],
+            custom_section={"key": "value"},
+        )
+        providers = manager._config.providers
+        
+        manager.update_config(version="2.0.0", ui={"theme": "custom-theme"})
+        
+        assert manager._config.version == "2.0.0"
+        assert isinstance(manager._config.ui, UIConfig)
+        assert manager._config.ui.theme == "custom-theme"
+        assert manager._config.providers == providers
+        assert manager._config.custom_section == {"key": "value"}
 
 
 @pytest.fixture
@@ -296,15 +568,23 @@ def sample_config_data() -> Dict[str, Any]:
 
 def test_config_roundtrip_with_toml(sample_config_data):
     """Test configuration can be serialized to and from TOML."""
+    # Only this test needs the TOML libraries; keep them out of collection
+    import tomli_w
+    
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+    
     # Create config from dict
     config = Config(**sample_config_data)
     
     # Convert to dict and back to TOML
-    config_dict = config.model_dump()
-    toml_string = toml.dumps(config_dict)
+    config_dict = config.model_dump(exclude_none=True)
+    toml_string = tomli_w.dumps(config_dict)
     
     # Parse TOML back to dict and create config
-    parsed_dict = toml.loads(toml_string)
+    parsed_dict = tomllib.loads(toml_string)
     parsed_config = Config(**parsed_dict)
     
     # Verify roundtrip integrity
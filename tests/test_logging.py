@@ -0,0 +1,563 @@
+"""
+Tests for logging setup and utilities.
+"""
+
+import io
+import json
+import logging
+import os
+import sys
+import time
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+from tokentracktui.utils import logging as logging_module
+from tokentracktui.utils.logging import StructuredFormatter, SecurityFilter
+
+
+def make_record(
+    msg: str = "Loaded %d providers",
+    args: tuple = (3,),
+    level: int = logging.INFO,
+    exc_info=None,
+    **extra,
+) -> logging.LogRecord:
+    """Build a log record the way Logger.makeRecord does."""
+    record = logging.LogRecord(
+        "tokentracktui.test", level, __file__, 42, msg, args, exc_info,
+        func="test_function",
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch) -> str:
+    """Run a test once per available JSON encoder."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(logging_module, "orjson", None)
+    return request.param
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Undo setup_logging's changes to the root logger after a test."""
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+    yield root_logger
+    logging_module._stop_queue_listener()
+    logging_module._configure_metrics_sampling(None)
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(level)
+
+
+class TestStructuredFormatter:
+    """Test the JSON formatter used for file logs."""
+    
+    def test_format_fields(self, encoder):
+        """Test the standard fields are emitted."""
+        entry = json.loads(StructuredFormatter().format(make_record()))
+        
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "tokentracktui.test"
+        assert entry["message"] == "Loaded 3 providers"
+        assert entry["module"] == "test_logging"
+        assert entry["function"] == "test_function"
+        assert entry["line"] == 42
+        assert "timestamp" in entry
+    
+    @pytest.mark.parametrize("created", [
+        1700000000.0, 1700000000.25, 1700000000.9999996, 1700000001.123456,
+    ])
+    def test_timestamp_matches_isoformat(self, created):
+        """Test cached timestamps match datetime's local ISO format."""
+        formatter = StructuredFormatter()
+        
+        for _ in range(2):  # Cold and cached
+            assert formatter._format_timestamp(created) == (
+                datetime.fromtimestamp(created).isoformat()
+            )
+    
+    def test_format_extra_fields(self, encoder):
+        """Test extra fields are included, falling back to str()."""
+        record = make_record(provider="gcp", path=Path("/tmp/x"))
+        entry = json.loads(StructuredFormatter().format(record))
+        
+        assert entry["provider"] == "gcp"
+        assert entry["path"] == "/tmp/x"
+    
+    def test_format_extra_dates_and_decimals(self, encoder):
+        """Test dates use ISO format and decimals keep their exact value."""
+        record = make_record(
+            fetched_at=datetime(2024, 1, 2, 3, 4, 5), cost=Decimal("1.10")
+        )
+        entry = json.loads(StructuredFormatter().format(record))
+        
+        assert entry["fetched_at"] == "2024-01-02T03:04:05"
+        assert entry["cost"] == "1.10"
+    
+    def test_format_without_extra_fields(self, encoder):
+        """Test extra fields are left out when disabled."""
+        record = make_record(provider="gcp")
+        entry = json.loads(StructuredFormatter(include_extra=False).format(record))
+        
+        assert "provider" not in entry
+    
+    def test_format_exception(self, encoder):
+        """Test exception tracebacks are included."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record(exc_info=sys.exc_info())
+        
+        entry = json.loads(StructuredFormatter().format(record))
+        
+        assert "ValueError: boom" in entry["exception"]
+    
+    def test_template_output_matches_json_dumps(self, monkeypatch):
+        """Test the stdlib fast path lays entries out like json.dumps."""
+        monkeypatch.setattr(logging_module, "orjson", None)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record(exc_info=sys.exc_info(), provider="gcp", count=2)
+        
+        output = StructuredFormatter().format(record)
+        
+        assert output == json.dumps(json.loads(output))
+    
+    def test_extra_field_replaces_fixed_field(self, encoder):
+        """Test an extra named like a fixed field replaces it once."""
+        output = StructuredFormatter().format(make_record(function="dashboard_load"))
+        
+        assert output.count('"function"') == 1
+        assert json.loads(output)["function"] == "dashboard_load"
+    
+    @pytest.mark.parametrize("record", [
+        logging.LogRecord("tokentracktui.test", logging.INFO, __file__, 42,
+                          "hello", (), None, func=None),
+        logging.makeLogRecord({"msg": "hello"}),
+    ], ids=["func-none", "make-log-record"])
+    def test_format_record_with_missing_fields(self, encoder, record):
+        """Test fields left unset on hand-built records are written as null."""
+        entry = json.loads(StructuredFormatter().format(record))
+        
+        assert entry["message"] == "hello"
+        assert entry["function"] is None
+    
+    def test_format_non_ascii_message(self, encoder):
+        """Test non-ASCII and control characters survive encoding."""
+        record = make_record(msg='Neural ⬢ "graph"\n\tready', args=())
+        entry = json.loads(StructuredFormatter().format(record))
+        
+        assert entry["message"] == 'Neural ⬢ "graph"\n\tready'
+
+
+class TestConsoleFormatter:
+    """Test the human-readable console formatter."""
+    
+    @pytest.fixture
+    def reference_formatter(self) -> logging.Formatter:
+        """A stock formatter with the console layout."""
+        formatter = logging_module.ConsoleFormatter()
+        return logging.Formatter(formatter._fmt, formatter.datefmt)
+    
+    def test_matches_stock_formatter(self, reference_formatter):
+        """Test output matches logging.Formatter with the same layout."""
+        formatter = logging_module.ConsoleFormatter()
+        record = make_record()
+        
+        for _ in range(2):  # Cold and cached clock time
+            assert formatter.format(record) == reference_formatter.format(record)
+    
+    def test_includes_exception_and_stack(self, reference_formatter):
+        """Test tracebacks and stack info are appended."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record(exc_info=sys.exc_info())
+        record.stack_info = "Stack (most recent call last):\n  test"
+        
+        output = logging_module.ConsoleFormatter().format(record)
+        
+        assert "ValueError: boom" in output
+        assert output == reference_formatter.format(record)
+
+
+class TestFdStreamHandler:
+    """Test the console handler's direct descriptor writes."""
+    
+    def test_writes_to_descriptor(self, tmp_path):
+        """Test records are written to the stream's file descriptor."""
+        with open(tmp_path / "out.txt", "w", encoding="utf-8") as stream:
+            stream.write("before\n")
+            handler = logging_module._FdStreamHandler(stream)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            
+            handler.handle(make_record(msg="Neural ⬢ ready", args=()))
+            
+            assert handler._fd == stream.fileno()
+        
+        assert (tmp_path / "out.txt").read_text(encoding="utf-8") == (
+            "before\nNeural ⬢ ready\n"
+        )
+    
+    def test_falls_back_without_descriptor(self):
+        """Test streams without a descriptor are written to normally."""
+        stream = io.StringIO()
+        handler = logging_module._FdStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        
+        handler.handle(make_record())
+        
+        assert handler._fd is None
+        assert stream.getvalue() == "Loaded 3 providers\n"
+
+
+class TestSamplingFilter:
+    """Test rate limiting of high-frequency records."""
+    
+    @pytest.fixture
+    def sampling_filter(self) -> logging_module.SamplingFilter:
+        """A filter allowing two records per second on a manual clock."""
+        sampling_filter = logging_module.SamplingFilter(rate=2)
+        sampling_filter.now = 100.0
+        sampling_filter._clock = lambda: sampling_filter.now
+        return sampling_filter
+    
+    def test_drops_records_over_rate(self, sampling_filter):
+        """Test records beyond the bucket are dropped until it refills."""
+        kept = [sampling_filter.filter(make_record()) for _ in range(3)]
+        assert kept == [True, True, False]
+        assert sampling_filter.dropped == 1
+        
+        sampling_filter.now += 0.5
+        assert sampling_filter.filter(make_record()) is True
+        assert sampling_filter.filter(make_record()) is False
+    
+    def test_keeps_one_in_n_over_rate(self, sampling_filter):
+        """Test every sample_every-th record over the rate is still kept."""
+        sampling_filter.sample_every = 3
+        kept = [sampling_filter.filter(make_record()) for _ in range(8)]
+        
+        assert kept == [True, True, False, False, True, False, False, True]
+        assert sampling_filter.dropped == 4
+    
+    def test_fractional_rate(self):
+        """Test rates below one record per second still let records through."""
+        sampling_filter = logging_module.SamplingFilter(rate=0.5)
+        sampling_filter.now = 100.0
+        sampling_filter._clock = lambda: sampling_filter.now
+        
+        assert sampling_filter.filter(make_record()) is True
+        assert sampling_filter.filter(make_record()) is False
+        
+        sampling_filter.now += 1
+        assert sampling_filter.filter(make_record()) is False
+        sampling_filter.now += 1
+        assert sampling_filter.filter(make_record()) is True
+    
+    @pytest.mark.parametrize("kwargs", [
+        {"rate": 0},
+        {"rate": -1},
+        {"rate": 1, "sample_every": 0},
+    ])
+    def test_rejects_invalid_settings(self, kwargs):
+        """Test non-positive rates and sample intervals are rejected."""
+        with pytest.raises(ValueError):
+            logging_module.SamplingFilter(**kwargs)
+    
+    def test_buckets_per_level(self, sampling_filter):
+        """Test each level is limited separately."""
+        for _ in range(2):
+            sampling_filter.filter(make_record())
+        
+        assert sampling_filter.filter(make_record(level=logging.DEBUG)) is True
+    
+    def test_never_drops_warnings(self, sampling_filter):
+        """Test WARNING and above always pass."""
+        records = [make_record(level=logging.WARNING) for _ in range(5)]
+        
+        assert all(sampling_filter.filter(record) for record in records)
+    
+    def test_setup_installs_one_filter(self, tmp_path, restore_root_logger):
+        """Test setup_logging replaces the metric loggers' sampling filter."""
+        kwargs = dict(enable_file_logging=False, enable_console_logging=False,
+                      enable_textual_logging=False)
+        logging_module.setup_logging(metrics_rate_limit=10, **kwargs)
+        logging_module.setup_logging(metrics_rate_limit=20, **kwargs)
+        
+        filters = [f for f in logging_module._API_LOGGER.filters
+                   if isinstance(f, logging_module.SamplingFilter)]
+        assert [f.rate for f in filters] == [20]
+
+
+class TestBufferedRotatingFileHandler:
+    """Test the buffered file handler used for file logs."""
+    
+    @pytest.fixture
+    def make_handler(self, tmp_path):
+        """Create handlers writing to tmp_path, closing them afterwards."""
+        handlers = []
+        
+        def factory(**kwargs) -> logging_module.BufferedRotatingFileHandler:
+            kwargs.setdefault("flush_interval", 60)
+            handler = logging_module.BufferedRotatingFileHandler(
+                tmp_path / "app.log", encoding="utf-8", **kwargs
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            handlers.append(handler)
+            return handler
+        
+        yield factory
+        for handler in handlers:
+            handler.close()
+    
+    def test_buffers_until_flush(self, make_handler, tmp_path):
+        """Test INFO records are buffered and ERROR records flushed."""
+        handler = make_handler()
+        log_file = tmp_path / "app.log"
+        
+        handler.handle(make_record(msg="first", args=()))
+        assert log_file.read_text() == ""
+        
+        handler.handle(make_record(msg="second", args=(), level=logging.ERROR))
+        assert log_file.read_text() == "first\nsecond\n"
+    
+    def test_periodic_flush(self, make_handler, tmp_path):
+        """Test the background thread flushes buffered records."""
+        handler = make_handler(flush_interval=0.01)
+        handler.handle(make_record(msg="first", args=()))
+        
+        log_file = tmp_path / "app.log"
+        for _ in range(200):
+            if log_file.read_text():
+                break
+            time.sleep(0.01)
+        
+        assert log_file.read_text() == "first\n"
+    
+    def test_rollover(self, make_handler, tmp_path):
+        """Test the file rotates once the tracked size reaches maxBytes."""
+        (tmp_path / "app.log").write_text("x" * 10 + "\n")
+        handler = make_handler(maxBytes=20, backupCount=1)
+        
+        handler.handle(make_record(msg="y" * 10, args=()))
+        handler.handle(make_record(msg="z" * 5, args=()))
+        handler.close()
+        
+        assert (tmp_path / "app.log.1").read_text() == "x" * 10 + "\n"
+        assert (tmp_path / "app.log").read_text() == "y" * 10 + "\n" + "z" * 5 + "\n"
+    
+    def test_rollover_counts_bytes(self, make_handler, tmp_path):
+        """Test non-ASCII text counts towards maxBytes by its encoded size."""
+        handler = make_handler(maxBytes=30, backupCount=1)
+        
+        # 5 characters but 15 bytes (+ newline) in UTF-8
+        handler.handle(make_record(msg="⬢" * 5, args=()))
+        handler.handle(make_record(msg="⬢" * 5, args=()))
+        handler.close()
+        
+        assert (tmp_path / "app.log.1").read_text(encoding="utf-8") == "⬢" * 5 + "\n"
+        assert (tmp_path / "app.log").read_text(encoding="utf-8") == "⬢" * 5 + "\n"
+        assert os.path.getsize(tmp_path / "app.log") == handler._size
+
+
+class TestSecurityFilter:
+    """Test redaction of sensitive log messages."""
+    
+    @pytest.mark.parametrize("msg,args", [
+        ("Using api_key %s", ("abc",)),
+        ("Request failed: %s", ("Bearer abc",)),
+        ("PASSWORD rejected", ()),
+    ])
+    def test_redacts_sensitive_messages(self, msg, args):
+        """Test sensitive templates and arguments are redacted."""
+        record = make_record(msg=msg, args=args)
+        
+        assert SecurityFilter().filter(record) is True
+        assert record.getMessage() == "[REDACTED - Sensitive information filtered]"
+    
+    def test_redacted_records_drop_extras(self, encoder):
+        """Test structured output of a redacted record omits its extras."""
+        record = make_record(msg="Using token %s", args=("abc",), credential="abc")
+        SecurityFilter().filter(record)
+        
+        entry = json.loads(StructuredFormatter().format(record))
+        
+        assert entry["message"] == "[REDACTED - Sensitive information filtered]"
+        assert "credential" not in entry
+        assert "_redacted" not in entry
+    
+    def test_redacts_template_without_formatting(self):
+        """Test a sensitive template is redacted before %-formatting."""
+        # Formatting these args would raise, so this only passes unformatted
+        record = make_record(msg="token %d", args=("not a number",))
+        
+        assert SecurityFilter().filter(record) is True
+        assert record.getMessage() == "[REDACTED - Sensitive information filtered]"
+    
+    def test_scans_each_record_once(self, monkeypatch):
+        """Test a shared filter skips records it has already checked."""
+        security_filter = SecurityFilter()
+        record = make_record()
+        security_filter.filter(record)
+        monkeypatch.setattr(security_filter, "_pattern", None)
+        
+        assert security_filter.filter(record) is True
+        assert "_security_filter" not in json.loads(StructuredFormatter().format(record))
+    
+    def test_passes_plain_messages(self):
+        """Test ordinary messages are left untouched."""
+        record = make_record()
+        
+        assert SecurityFilter().filter(record) is True
+        assert record.getMessage() == "Loaded 3 providers"
+
+
+class TestGetLogger:
+    """Test logger lookup with bound context."""
+    
+    def test_plain_logger(self):
+        """Test loggers without context are returned directly."""
+        assert logging_module.get_logger("tokentracktui.test") is (
+            logging.getLogger("tokentracktui.test")
+        )
+    
+    def test_context_is_bound(self, caplog):
+        """Test bound context is a snapshot added to every record."""
+        caplog.set_level(logging.INFO, logger="tokentracktui")
+        context = {"provider": "gcp"}
+        logger = logging_module.get_logger("tokentracktui.test", context)
+        context["provider"] = "openai"
+        
+        logger.info("Fetching usage")
+        
+        assert caplog.records[-1].provider == "gcp"
+
+
+class TestMetricHelpers:
+    """Test the performance and API call logging helpers."""
+    
+    def test_log_performance(self, caplog):
+        """Test performance metrics are logged with their extras."""
+        caplog.set_level(logging.INFO, logger="tokentracktui")
+        
+        logging_module.log_performance("dashboard_load", 0.5, provider_count=2)
+        
+        record = caplog.records[-1]
+        assert record.getMessage() == "Performance: dashboard_load completed in 0.500s"
+        assert record.performance_metric is True
+        assert record.provider_count == 2
+    
+    @pytest.mark.parametrize("status_code,duration,expected", [
+        (200, 0.25, "API Call: GET /usage -> 200 (0.250s)"),
+        (404, None, "API Call: GET /usage -> 404"),
+        (None, 1.5, "API Call: GET /usage (1.500s)"),
+        (None, None, "API Call: GET /usage"),
+    ])
+    def test_log_api_call(self, caplog, status_code, duration, expected):
+        """Test API calls are logged with optional status and duration."""
+        caplog.set_level(logging.INFO, logger="tokentracktui")
+        
+        logging_module.log_api_call(
+            "gcp", "/usage", status_code=status_code, duration=duration
+        )
+        
+        record = caplog.records[-1]
+        assert record.getMessage() == expected
+        assert record.provider == "gcp"
+    
+    def test_helpers_skip_disabled_level(self, caplog):
+        """Test nothing is logged when INFO is disabled."""
+        caplog.set_level(logging.WARNING, logger="tokentracktui")
+        
+        logging_module.log_performance("dashboard_load", 0.5)
+        logging_module.log_api_call("gcp", "/usage")
+        
+        assert not caplog.records
+
+
+class TestSetupLogging:
+    """Test the handler pipeline installed by setup_logging."""
+    
+    def test_file_logging_through_queue(self, tmp_path, restore_root_logger):
+        """Test records reach the log file via the background listener."""
+        log_file = tmp_path / "app.log"
+        logging_module.setup_logging(
+            log_file=log_file,
+            enable_console_logging=False,
+            enable_textual_logging=False,
+        )
+        
+        assert [type(h) for h in restore_root_logger.handlers] == [
+            logging_module._RecordQueueHandler
+        ]
+        
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("tokentracktui.test").exception("Failed %s", "loading")
+        logging_module._stop_queue_listener()
+        
+        entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert entries[-1]["message"] == "Failed loading"
+        assert "ValueError: boom" in entries[-1]["exception"]
+    
+    @pytest.mark.parametrize("isatty", [True, False])
+    def test_textual_handler_only_on_terminal(
+        self, monkeypatch, restore_root_logger, isatty
+    ):
+        """Test the Textual handler is only added when stdout is a terminal."""
+        monkeypatch.setattr(logging_module, "_stdout_is_terminal", lambda: isatty)
+        logging_module.setup_logging(
+            enable_file_logging=False, enable_console_logging=False
+        )
+        
+        handler_names = [type(h).__name__ for h in restore_root_logger.handlers]
+        assert ("TextualHandler" in handler_names) is isatty
+    
+    @pytest.mark.parametrize("fileno,console_queued", [
+        (None, True),
+        (lambda: -1, False),  # Textual's stdout capture
+        (io.StringIO().fileno, False),  # Raises io.UnsupportedOperation
+    ], ids=["fd", "negative-fd", "no-fd"])
+    def test_console_queued_only_with_real_fd(
+        self, tmp_path, monkeypatch, restore_root_logger, fileno, console_queued
+    ):
+        """Test the console handler only moves to the listener with a real fd."""
+        with open(tmp_path / "console.log", "w") as stdout:
+            if fileno is not None:
+                monkeypatch.setattr(stdout, "fileno", fileno, raising=False)
+            monkeypatch.setattr(sys, "stdout", stdout)
+            logging_module.setup_logging(
+                log_file=tmp_path / "app.log", enable_textual_logging=False
+            )
+            
+            queued = [type(h) for h in logging_module._queue_listener.handlers]
+            inline = [type(h) for h in restore_root_logger.handlers]
+            logging_module._stop_queue_listener()
+        
+        console = logging_module._FdStreamHandler
+        file_handler = logging_module.BufferedRotatingFileHandler
+        if console_queued:
+            assert queued == [console, file_handler]
+            assert inline == [logging_module._RecordQueueHandler]
+        else:
+            assert queued == [file_handler]
+            assert inline == [console, logging_module._RecordQueueHandler]
+    
+    def test_setup_replaces_listener(self, tmp_path, restore_root_logger):
+        """Test calling setup again stops the previous listener."""
+        kwargs = dict(enable_console_logging=False, enable_textual_logging=False)
+        logging_module.setup_logging(log_file=tmp_path / "a.log", **kwargs)
+        first = logging_module._queue_listener
+        logging_module.setup_logging(log_file=tmp_path / "b.log", **kwargs)
+        
+        assert logging_module._queue_listener is not first
+        assert first._thread is None
+        assert len(restore_root_logger.handlers) == 1
@@ -14,7 +14,14 @@ __codename__ = "Neural Nexus"
 __author__ = "TokenTrackTUI Team"
 __email__ = "team@tokentracktui.dev"
 
-# Core exports
-from tokentracktui.core.app import TokenTrackTUIApp
+from typing import Any
 
-__all__ = ["TokenTrackTUIApp", "__version__", "__codename__"] 
\ No newline at end of file
+__all__ = ["TokenTrackTUIApp", "__version__", "__codename__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import heavy exports so reading ``__version__`` stays cheap."""
+    if name == "TokenTrackTUIApp":
+        from tokentracktui.core.app import TokenTrackTUIApp
+        return TokenTrackTUIApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
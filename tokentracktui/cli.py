@@ -12,12 +12,8 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 
 from tokentracktui import __version__, __codename__
-from tokentracktui.core.app import create_app
-from tokentracktui.utils.logging import setup_logging
 
 # Initialize CLI app
 cli = typer.Typer(
@@ -30,10 +26,16 @@ cli = typer.Typer(
 
 console = Console()
 
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
 
 def version_callback(value: bool):
     """Show version information."""
     if value:
+        from rich.panel import Panel
+        from rich.text import Text
+        
         version_text = Text()
         version_text.append("TokenTrackTUI ", style="bold blue")
         version_text.append(f"v{__version__}", style="bold green")
@@ -101,15 +103,19 @@ def main(
         console.print("[yellow]Debug mode enabled[/yellow]")
     
     # Validate log level
-    valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-    if log_level.upper() not in valid_levels:
+    level = log_level.upper()
+    if level not in _VALID_LOG_LEVELS:
         console.print(f"[red]Error:[/red] Invalid log level '{log_level}'. "
-                     f"Valid levels: {', '.join(valid_levels)}")
+                     f"Valid levels: {', '.join(_LOG_LEVELS)}")
         raise typer.Exit(1)
     
+    # Deferred so --version/--help and option errors never load Textual
+    from tokentracktui.core.app import create_app
+    from tokentracktui.utils.logging import setup_logging
+    
     # Setup basic logging for CLI
     setup_logging(
-        level=log_level.upper(),
+        level=level,
         enable_console_logging=not debug,  # Avoid duplicate console logs in debug
         enable_textual_logging=False,
         enable_file_logging=True,
@@ -123,7 +129,7 @@ def main(
         # Create and run the application
         app = create_app(
             config_dir=config_dir,
-            log_level=log_level.upper(),
+            log_level=level,
         )
         
         # Handle dry-run mode
@@ -180,6 +186,8 @@ def config(
     View, edit, or reset application configuration including provider
     settings, UI preferences, and logging options.
     """
+    from rich.panel import Panel
+    
     from tokentracktui.core.config import ConfigManager
     
     config_manager = ConfigManager(config_dir)
@@ -199,6 +207,7 @@ def config(
         # Show current configuration
         try:
             config = config_manager.load_config()
+            config_manager.ensure_persisted()
             console.print(Panel(
                 f"Configuration file: {config_manager.config_file}\n"
                 f"Version: {config.version}\n"
@@ -245,6 +254,9 @@ def providers(
 
 def _show_startup_banner() -> None:
     """Display startup banner."""
+    from rich.panel import Panel
+    from rich.text import Text
+    
     banner_text = Text()
     banner_text.append("⬢ ", style="bold cyan")
     banner_text.append("TokenTrackTUI", style="bold blue")
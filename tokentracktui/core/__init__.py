@@ -5,7 +5,17 @@ Contains the main application logic, configuration management,
 and provider interface definitions.
 """
 
-from tokentracktui.core.app import TokenTrackTUIApp
-from tokentracktui.core.config import Config, ConfigManager
+from typing import Any
 
-__all__ = ["TokenTrackTUIApp", "Config", "ConfigManager"] 
\ No newline at end of file
+__all__ = ["TokenTrackTUIApp", "Config", "ConfigManager"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import exports so importing a submodule doesn't load Textual."""
+    if name == "TokenTrackTUIApp":
+        from tokentracktui.core.app import TokenTrackTUIApp
+        return TokenTrackTUIApp
+    if name in ("Config", "ConfigManager"):
+        from tokentracktui.core import config
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,16 +6,16 @@ configuration loading, and the foundational Neural Nexus interface.
 """
 
 import asyncio
+import functools
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Tuple
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.screen import Screen
-from textual.widgets import Header, Footer, Static, LoadingIndicator
-from textual.containers import Container, Horizontal, Vertical
-from textual import events
+from textual.widgets import Static, LoadingIndicator
+from textual.containers import Container, Horizontal
 
 from tokentracktui.core.config import ConfigManager, Config, ConfigError
 from tokentracktui.utils.logging import setup_logging, get_logger, log_performance
@@ -24,6 +24,10 @@ from tokentracktui import __version__, __codename__
 
 logger = get_logger(__name__)
 
+# Resolved once at import; the stylesheet ships next to the package root
+_CSS_PATH = Path(__file__).resolve().parent.parent / "neural-nexus.tcss"
+_CSS_PATHS = [_CSS_PATH] if _CSS_PATH.exists() else []
+
 
 class NeuralHeader(Static):
     """Neural Nexus styled header widget."""
@@ -52,16 +56,21 @@ class NeuralHeader(Static):
         super().__init__(**kwargs)
         self.title = title
         self.status = "◐ Initializing"
+        self._status_widget: Optional[Static] = None
     
     def compose(self) -> ComposeResult:
+        self._status_widget = Static(self.status, classes="status")
         with Horizontal():
             yield Static(self.title, classes="title")
-            yield Static(self.status, classes="status")
+            yield self._status_widget
     
     def update_status(self, status: str) -> None:
         """Update the status indicator."""
         self.status = status
-        self.refresh()
+        # Only the inner status widget needs repainting; before compose the
+        # stored value is picked up when it is created
+        if self._status_widget is not None:
+            self._status_widget.update(status)
 
 
 class NeuralFooter(Static):
@@ -83,14 +92,17 @@ class NeuralFooter(Static):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.actions_text = "[R]efresh [H]elp [Q]uit"
+        self._actions_widget: Optional[Static] = None
     
     def compose(self) -> ComposeResult:
-        yield Static(self.actions_text, classes="actions")
+        self._actions_widget = Static(self.actions_text, classes="actions")
+        yield self._actions_widget
     
     def update_actions(self, actions: str) -> None:
         """Update the action text."""
         self.actions_text = actions
-        self.refresh()
+        if self._actions_widget is not None:
+            self._actions_widget.update(actions)
 
 
 class LoadingScreen(Screen):
@@ -128,6 +140,14 @@ class LoadingScreen(Screen):
             yield Static(__codename__, classes="loading-subtitle")
             yield LoadingIndicator()
             yield Static("Initializing Neural Nexus interface...", classes="loading-status")
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Set once the screen has been painted at least once
+        self.ready = asyncio.Event()
+    
+    def on_mount(self) -> None:
+        self.call_after_refresh(self.ready.set)
 
 
 class DashboardScreen(Screen):
@@ -182,6 +202,10 @@ class DashboardScreen(Screen):
         self.config = config
         self.header = NeuralHeader()
         self.footer = NeuralFooter()
+        
+        # Provider text and count derived from _summary_config
+        self._summary_config: Optional[Config] = None
+        self._provider_summary: Tuple[str, int] = ("", 0)
     
     def compose(self) -> ComposeResult:
         yield self.header
@@ -204,6 +228,12 @@ class DashboardScreen(Screen):
     async def on_mount(self) -> None:
         """Initialize dashboard when mounted."""
         logger.info("Dashboard screen mounted")
+        
+        # Look the panels up once rather than on every refresh
+        self._graph_content = self.query_one("#graph-content", Static)
+        self._overview_content = self.query_one("#overview-content", Static)
+        self._status_message = self.query_one("#status-message", Static)
+        
         self.header.update_status("◉ Live Mode")
         
         # Simulate loading data
@@ -217,30 +247,20 @@ class DashboardScreen(Screen):
             # Simulate data loading
             await asyncio.sleep(0.5)  # Simulate network delay
             
+            provider_text, provider_count = self._get_provider_summary()
+            
             # Update neural graph panel
-            graph_content = self.query_one("#graph-content", Static)
-            if self.config.providers:
-                provider_lines = []
-                for i, provider in enumerate(self.config.providers):
-                    status = "◉" if provider.enabled else "○"
-                    provider_lines.append(f"  {status} {provider.name} ({provider.type})")
-                
-                graph_content.update("\n".join(provider_lines))
-            else:
-                graph_content.update("No providers configured\nUse 'c' to configure providers")
+            self._graph_content.update(provider_text)
             
             # Update overview panel
-            overview_content = self.query_one("#overview-content", Static)
-            overview_content.update(
+            self._overview_content.update(
                 "Total Usage: --- tokens\n"
                 "Total Cost: $---.--\n"
                 "Active Providers: 0"
             )
             
             # Update status
-            status_msg = self.query_one("#status-message", Static)
-            provider_count = len([p for p in self.config.providers if p.enabled])
-            status_msg.update(f"Ready • {provider_count} provider(s) configured")
+            self._status_message.update(f"Ready • {provider_count} provider(s) configured")
             
             duration = time.time() - start_time
             log_performance("dashboard_load", duration, provider_count=provider_count)
@@ -249,6 +269,28 @@ class DashboardScreen(Screen):
             logger.error(f"Failed to load dashboard data: {e}")
             self.notify("Failed to load dashboard data", severity="error")
     
+    def _get_provider_summary(self) -> Tuple[str, int]:
+        """Get the provider graph text and enabled provider count.
+        
+        Configs are immutable, so the result is rebuilt only when
+        ``self.config`` is replaced.
+        """
+        if self._summary_config is not self.config:
+            providers = self.config.providers
+            if providers:
+                provider_text = "\n".join(
+                    f"  {'◉' if p.enabled else '○'} {p.name} ({p.type})"
+                    for p in providers
+                )
+            else:
+                provider_text = "No providers configured\nUse 'c' to configure providers"
+            
+            enabled_count = sum(1 for p in providers if p.enabled)
+            self._provider_summary = (provider_text, enabled_count)
+            self._summary_config = self.config
+        
+        return self._provider_summary
+    
     async def action_refresh(self) -> None:
         """Refresh dashboard data."""
         logger.info("Refreshing dashboard data")
@@ -298,10 +340,7 @@ class TokenTrackTUIApp(App):
     ):
         super().__init__(**kwargs)
         
-        # Set CSS path relative to the module
-        import tokentracktui
-        css_path = Path(tokentracktui.__file__).parent / "neural-nexus.tcss"
-        self.css_path = [css_path] if css_path.exists() else []
+        self.css_path = list(_CSS_PATHS)
         
         self.config_manager = ConfigManager(config_dir)
         self.config: Optional[Config] = None
@@ -321,10 +360,14 @@ class TokenTrackTUIApp(App):
             logger.info(f"Starting TokenTrackTUI {__version__} - {__codename__}")
             
             # Show loading screen
-            await self.push_screen(LoadingScreen())
+            loading_screen = LoadingScreen()
+            await self.push_screen(loading_screen)
             
-            # Load configuration
-            await self._load_configuration()
+            # Load configuration while the loading screen gets its first paint
+            await asyncio.gather(
+                self._load_configuration(),
+                loading_screen.ready.wait(),
+            )
             
             # Initialize main dashboard
             await self._initialize_dashboard()
@@ -357,7 +400,8 @@ class TokenTrackTUIApp(App):
     async def _load_configuration(self) -> None:
         """Load application configuration."""
         try:
-            self.config = self.config_manager.load_config()
+            # Disk I/O and validation run off the event loop
+            self.config = await asyncio.to_thread(self.config_manager.load_config)
             logger.info(f"Loaded configuration with {len(self.config.providers)} providers")
             
             # Update logging if config specifies different settings
@@ -373,14 +417,9 @@ class TokenTrackTUIApp(App):
     
     async def _initialize_dashboard(self) -> None:
         """Initialize and show the main dashboard."""
-        # Small delay to show loading screen
-        await asyncio.sleep(0.2)
-        
         dashboard = DashboardScreen(self.config)
-        await self.push_screen(dashboard)
-        
-        # Pop the loading screen
-        self.pop_screen()
+        # Replace the loading screen rather than stacking on top of it
+        await self.switch_screen(dashboard)
     
     async def action_toggle_dark(self) -> None:
         """Toggle dark mode."""
@@ -396,7 +435,7 @@ class TokenTrackTUIApp(App):
         # Save any pending configuration changes
         try:
             if self.config:
-                self.config_manager.save_config()
+                await asyncio.to_thread(self.config_manager.save_config)
         except Exception as e:
             logger.warning(f"Failed to save config on exit: {e}")
         
@@ -415,12 +454,25 @@ class TokenTrackTUIApp(App):
         self.notify(f"Internal error: {exception}", severity="error")
 
 
+@functools.lru_cache(maxsize=1)
+def _install_event_loop_policy() -> None:
+    """Run on uvloop when the optional ``speedups`` extra is installed."""
+    try:
+        import uvloop
+    except ImportError:  # Not installed, or unsupported platform (Windows)
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def create_app(
     config_dir: Optional[Path] = None,
     log_level: str = "INFO",
     **kwargs
 ) -> TokenTrackTUIApp:
     """Create and configure a TokenTrackTUI application instance."""
+    # Textual creates its event loop in run(), so the policy applies from here
+    _install_event_loop_policy()
     return TokenTrackTUIApp(
         config_dir=config_dir,
         log_level=log_level,
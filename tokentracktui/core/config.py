@@ -5,20 +5,29 @@ Handles loading, validation, and management of user configuration including
 provider settings, UI themes, and application preferences.
 """
 
+import functools
+import hashlib
 import os
-import toml
+import pickle
+import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, Optional, List, Tuple, Union
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 import logging
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
 logger = logging.getLogger(__name__)
 
 
 class ProviderConfig(BaseModel):
     """Configuration for a single provider."""
     
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Display name for the provider")
     type: str = Field(..., description="Provider type (e.g., 'gcp', 'openai')")
     enabled: bool = Field(True, description="Whether this provider is enabled")
@@ -37,6 +46,8 @@ class ProviderConfig(BaseModel):
 class UIConfig(BaseModel):
     """UI and theming configuration."""
     
+    model_config = ConfigDict(frozen=True)
+    
     theme: str = Field("neural-nexus", description="Active theme name")
     terminal_width_min: int = Field(80, description="Minimum terminal width")
     terminal_width_optimal: int = Field(120, description="Optimal terminal width")
@@ -49,6 +60,8 @@ class UIConfig(BaseModel):
 class AppConfig(BaseModel):
     """Application-level configuration."""
     
+    model_config = ConfigDict(frozen=True)
+    
     log_level: str = Field("INFO", description="Logging level")
     log_file: Optional[str] = Field(None, description="Log file path")
     cache_ttl: int = Field(3600, description="Cache TTL in seconds")
@@ -59,7 +72,10 @@ class AppConfig(BaseModel):
 class Config(BaseModel):
     """Main configuration object for TokenTrackTUI."""
     
-    model_config = ConfigDict(extra="allow")  # Allow additional fields for extensibility
+    model_config = ConfigDict(
+        frozen=True,
+        extra="allow",  # Allow additional fields for extensibility
+    )
     
     version: str = Field("1.0.0", description="Config version")
     app: AppConfig = Field(default_factory=AppConfig)
@@ -67,6 +83,59 @@ class Config(BaseModel):
     providers: List[ProviderConfig] = Field(default_factory=list)
 
 
+# Private copies of loaded configs per file, keyed on the (st_mtime_ns, st_size)
+# they were read at; managers only ever see deep copies of these
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, Config]] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config_dict() -> Dict[str, Any]:
+    """Raw data for the default configuration with mock provider.
+    
+    Cached and shared between calls, so it must never be mutated; validation
+    copies it into fresh model instances.
+    """
+    return {
+        "providers": [
+            {
+                "name": "Mock Provider",
+                "type": "mock",
+                "enabled": True,
+                "credentials": {},
+                "settings": {
+                    "generate_realistic_data": True,
+                    "data_points": 100
+                },
+            }
+        ]
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_config_dir(base: Optional[str], home: Optional[str]) -> Path:
+    """Build the config directory for one environment; ``home`` only keys the cache."""
+    if base:
+        return Path(base) / 'tokentracktui'
+    if os.name == 'nt':  # Windows
+        return Path.home() / 'AppData' / 'Roaming' / 'tokentracktui'
+    return Path.home() / '.config' / 'tokentracktui'  # Unix-like
+
+
+def _default_config_dir() -> Path:
+    """Get the default configuration directory.
+    
+    The environment is read on every call, so later changes take effect; the
+    result is cached per value, and the home directory is only looked up
+    when the base directory variable is unset.
+    """
+    if os.name == 'nt':  # Windows
+        base_var, home_var = 'APPDATA', 'USERPROFILE'
+    else:  # Unix-like
+        base_var, home_var = 'XDG_CONFIG_HOME', 'HOME'
+    base = os.environ.get(base_var)
+    return _resolve_config_dir(base, None if base else os.environ.get(home_var))
+
+
 class ConfigManager:
     """Manages configuration loading, saving, and validation."""
     
@@ -79,47 +148,87 @@ class ConfigManager:
         """
         # Handle None or convert to Path
         if config_dir is None:
-            self.config_dir = self._get_default_config_dir()
+            self.config_dir = _default_config_dir()
         else:
             # Handle Typer OptionInfo objects that might slip through
             if hasattr(config_dir, 'default') or str(type(config_dir).__name__) == 'OptionInfo':
-                self.config_dir = self._get_default_config_dir()
+                self.config_dir = _default_config_dir()
             else:
                 # Handle both Path objects and strings
                 self.config_dir = Path(config_dir) if not isinstance(config_dir, Path) else config_dir
         
         self.config_file = self.config_dir / "tokentracktui_config.toml"
-        self._config: Optional[Config] = None
+        # Pickled data of config_file, checked by mtime and checksum and then
+        # re-validated; pickle keeps TOML datetimes and inf intact, unlike JSON
+        self.cache_file = self.config_dir / "tokentracktui_config.cache.pkl"
+        self._loaded_config: Optional[Config] = None
+        # Provider name -> positions in providers, rebuilt lazily after changes
+        self._provider_index: Optional[Dict[str, List[int]]] = None
+        self._enabled_cache: Optional[Tuple[ProviderConfig, ...]] = None
+        # Set while the loaded config is an unsaved default
+        self._pending_default = False
         
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
     
-    def _get_default_config_dir(self) -> Path:
-        """Get the default configuration directory."""
-        if os.name == 'nt':  # Windows
-            base = Path(os.environ.get('APPDATA', Path.home() / 'AppData' / 'Roaming'))
-        else:  # Unix-like
-            base = Path(os.environ.get('XDG_CONFIG_HOME', Path.home() / '.config'))
-        
-        return base / 'tokentracktui'
+    @property
+    def _config(self) -> Optional[Config]:
+        """The currently loaded configuration."""
+        return self._loaded_config
+    
+    @_config.setter
+    def _config(self, config: Optional[Config]) -> None:
+        # Every replacement of the config invalidates state derived from it
+        self._loaded_config = config
+        self._provider_index = None
+        self._enabled_cache = None
+    
+    def _get_provider_index(self) -> Dict[str, List[int]]:
+        """Get the provider name index, building it if necessary."""
+        if self._provider_index is None:
+            index: Dict[str, List[int]] = {}
+            for position, provider in enumerate(self._config.providers):
+                index.setdefault(provider.name, []).append(position)
+            self._provider_index = index
+        return self._provider_index
     
     def load_config(self) -> Config:
-        """Load configuration from file or create default."""
+        """Load configuration from file or create default.
+        
+        A missing file yields the default configuration without writing it;
+        it is persisted on the first save, mutation or ``ensure_persisted``.
+        """
+        self._pending_default = False
         if not self.config_file.exists():
-            logger.info(f"Config file not found at {self.config_file}, creating default")
+            logger.info(f"Config file not found at {self.config_file}, using default")
             self._config = self._create_default_config()
-            self.save_config()
+            self._pending_default = True
             return self._config
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_data = toml.load(f)
+            stat = self.config_file.stat()
+            cached = _CONFIG_CACHE.get(self.config_file)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                # Frozen is shallow - nested dicts and lists stay mutable - so
+                # every manager gets its own copy of the cached config
+                self._config = cached[2].model_copy(deep=True)
+                return self._config
             
-            self._config = Config(**config_data)
+            toml_bytes = self.config_file.read_bytes()
+            config = self._read_cache(toml_bytes)
+            if config is None:
+                config_data = tomllib.loads(toml_bytes.decode('utf-8'))
+                config = Config(**config_data)
+                self._write_cache(toml_bytes, config)
+            
+            _CONFIG_CACHE[self.config_file] = (
+                stat.st_mtime_ns, stat.st_size, config.model_copy(deep=True)
+            )
+            self._config = config
             logger.info(f"Loaded configuration from {self.config_file}")
             return self._config
             
-        except toml.TomlDecodeError as e:
+        except tomllib.TOMLDecodeError as e:
             logger.error(f"Invalid TOML in config file: {e}")
             raise ConfigError(f"Invalid TOML syntax in {self.config_file}: {e}")
         
@@ -134,33 +243,73 @@ class ConfigManager:
         if not self._config:
             raise ConfigError("No configuration loaded to save")
         
+        # Only needed when writing; keep it off the startup import path
+        import tomli_w
+        
         try:
-            config_dict = self._config.model_dump()
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                toml.dump(config_dict, f)
+            # TOML has no null value, so unset optional fields are omitted
+            toml_bytes = tomli_w.dumps(
+                self._config.model_dump(exclude_none=True)
+            ).encode('utf-8')
+            # Written in place (not renamed over) so symlinked configs survive
+            self.config_file.write_bytes(toml_bytes)
+            self._pending_default = False
+            
+            stat = self.config_file.stat()
+            _CONFIG_CACHE[self.config_file] = (
+                stat.st_mtime_ns, stat.st_size, self._config.model_copy(deep=True)
+            )
             
             logger.info(f"Configuration saved to {self.config_file}")
             
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
             raise ConfigError(f"Failed to save configuration: {e}")
+        
+        # Keep the parse cache in step so the next startup skips TOML parsing
+        self._write_cache(toml_bytes, self._config)
+    
+    def ensure_persisted(self) -> None:
+        """Write the configuration to disk if it so far only exists in memory."""
+        if not self._config:
+            self.load_config()
+        
+        if self._pending_default and not self.config_file.exists():
+            self.save_config()
+        self._pending_default = False
+    
+    def _read_cache(self, toml_bytes: bytes) -> Optional[Config]:
+        """Return the cached config if it is still valid for ``toml_bytes``."""
+        try:
+            if self.cache_file.stat().st_mtime_ns < self.config_file.stat().st_mtime_ns:
+                return None
+            checksum, config_data = pickle.loads(self.cache_file.read_bytes())
+            if checksum != hashlib.sha256(toml_bytes).digest() or not isinstance(config_data, dict):
+                return None
+            # Re-validated so a cache written against older models is never trusted
+            config = Config.model_validate(config_data)
+        except Exception:
+            # Missing, unreadable, corrupt or stale cache - fall back to parsing TOML
+            return None
+        
+        logger.debug(f"Using cached configuration from {self.cache_file}")
+        return config
+    
+    def _write_cache(self, toml_bytes: bytes, config: Config) -> None:
+        """Atomically write the config data next to the TOML source."""
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        try:
+            # Plain data rather than the model, which would unpickle unvalidated
+            payload = (hashlib.sha256(toml_bytes).digest(), config.model_dump())
+            tmp_file.write_bytes(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            # The cache is only an optimization; never fail a load or save over it
+            logger.debug(f"Failed to write config cache: {e}")
     
     def _create_default_config(self) -> Config:
         """Create a default configuration with mock provider."""
-        mock_provider = ProviderConfig(
-            name="Mock Provider",
-            type="mock",
-            enabled=True,
-            credentials={},
-            settings={
-                "generate_realistic_data": True,
-                "data_points": 100
-            }
-        )
-        
-        return Config(
-            providers=[mock_provider]
-        )
+        return Config.model_validate(_default_config_dict())
     
     def get_config(self) -> Config:
         """Get the current configuration, loading it if necessary."""
@@ -170,45 +319,69 @@ class ConfigManager:
     
     def update_config(self, **kwargs) -> None:
         """Update configuration with new values."""
-        if not self._config:
-            self.load_config()
+        # Persist a pending default first, as loading used to
+        self.ensure_persisted()
         
-        # Create a new config with updated values
-        config_dict = self._config.model_dump()
-        config_dict.update(kwargs)
-        self._config = Config(**config_dict)
+        # Validated nested models are reused as-is rather than dumped and
+        # rebuilt; only the updated values go through validation again
+        index, enabled = self._provider_index, self._enabled_cache
+        self._config = Config.model_validate({**dict(self._config), **kwargs})
+        if "providers" not in kwargs:
+            # Same provider list, so the derived state still holds
+            self._provider_index, self._enabled_cache = index, enabled
     
     def add_provider(self, provider_config: ProviderConfig) -> None:
         """Add a new provider configuration."""
-        if not self._config:
-            self.load_config()
+        # Persist a pending default first, as loading used to
+        self.ensure_persisted()
         
-        self._config.providers.append(provider_config)
+        # Models are frozen, so changes swap in an updated copy
+        index, enabled = self._provider_index, self._enabled_cache
+        self._config = self._config.model_copy(
+            update={"providers": [*self._config.providers, provider_config]}
+        )
+        if index is not None:
+            position = len(self._config.providers) - 1
+            index.setdefault(provider_config.name, []).append(position)
+            self._provider_index = index
+        if enabled is not None:
+            self._enabled_cache = (*enabled, provider_config) if provider_config.enabled else enabled
         logger.info(f"Added provider: {provider_config.name}")
     
     def remove_provider(self, provider_name: str) -> bool:
         """Remove a provider by name. Returns True if removed."""
-        if not self._config:
-            self.load_config()
+        # Persist a pending default first, as loading used to
+        self.ensure_persisted()
         
-        original_count = len(self._config.providers)
-        self._config.providers = [
-            p for p in self._config.providers 
-            if p.name != provider_name
-        ]
+        positions = self._get_provider_index().get(provider_name)
+        if not positions:
+            return False
         
-        removed = len(self._config.providers) < original_count
-        if removed:
-            logger.info(f"Removed provider: {provider_name}")
+        # Delete from the back so earlier positions stay valid
+        enabled = self._enabled_cache
+        providers = list(self._config.providers)
+        for position in reversed(positions):
+            del providers[position]
+        self._config = self._config.model_copy(update={"providers": providers})
+        if enabled is not None:
+            self._enabled_cache = tuple(p for p in enabled if p.name != provider_name)
         
-        return removed
+        logger.info(f"Removed provider: {provider_name}")
+        return True
     
-    def get_enabled_providers(self) -> List[ProviderConfig]:
+    def get_enabled_providers(self) -> Tuple[ProviderConfig, ...]:
         """Get all enabled provider configurations."""
         if not self._config:
             self.load_config()
         
-        return [p for p in self._config.providers if p.enabled]
+        if self._enabled_cache is None:
+            self._enabled_cache = tuple(p for p in self._config.providers if p.enabled)
+        return self._enabled_cache
+    
+    @property
+    def enabled_provider_count(self) -> int:
+        """Number of enabled providers."""
+        return len(self.get_enabled_providers())
 
 
 class ConfigError(Exception):
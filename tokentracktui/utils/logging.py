@@ -5,15 +5,94 @@ Provides structured logging with proper configuration for both file
 and console output, including integration with Textual's logging system.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
+import math
+import os
+import queue
+import re
+import stat
 import sys
+import threading
+import time
+from datetime import date
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple, Union
 import json
 
-from textual.logging import TextualHandler
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speedups" extra
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    """Convert a value JSON has no type for.
+    
+    Dates are written in ISO format, as orjson does natively, so both
+    encoders agree; anything else (paths, decimals, ...) falls back to str().
+    """
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+# Built once: json.dumps(..., default=...) would construct an encoder per call
+_JSON_ENCODER = json.JSONEncoder(default=_json_default)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a log entry to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder copes
+            pass
+    return _JSON_ENCODER.encode(obj)
+
+
+# Loggers for the metric helpers, looked up once rather than per call
+_PERF_LOGGER = logging.getLogger('tokentracktui.performance')
+_API_LOGGER = logging.getLogger('tokentracktui.api')
+
+
+# LogRecord attributes that are not user-supplied extras
+_STANDARD_RECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
+    'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process', 'message',
+    '_security_filter', '_redacted'
+})
+
+
+# Fixed leading fields of a structured entry, laid out as json.dumps would
+_ENTRY_TEMPLATE = (
+    '{"timestamp": "%s", "level": %s, "logger": %s, "message": %s, '
+    '"module": %s, "function": %s, "line": %s'
+)
+_ENTRY_FIELDS = frozenset({
+    'timestamp', 'level', 'logger', 'message', 'module', 'function', 'line',
+    'exception'
+})
+
+_json_str = json.encoder.encode_basestring_ascii
+
+
+def _json_field(value: Any) -> str:
+    """Encode a fixed field, which is a str or int except on hand-built records."""
+    if type(value) is str:
+        return _json_str(value)
+    if type(value) is int:
+        return str(value)
+    # e.g. LogRecord(func=None) or logging.makeLogRecord({...}) give None
+    return _JSON_ENCODER.encode(value)
 
 
 class StructuredFormatter(logging.Formatter):
@@ -22,13 +101,66 @@ class StructuredFormatter(logging.Formatter):
     def __init__(self, include_extra: bool = True):
         super().__init__()
         self.include_extra = include_extra
+        # (second, formatted date and time) of the last timestamp formatted
+        self._timestamp_cache = (None, '')
+    
+    def _format_timestamp(self, created: float) -> str:
+        """Format like ``datetime.fromtimestamp(created).isoformat()``.
+        
+        Records mostly arrive in bursts within the same second, so the date
+        and time part is reused and only the microseconds are formatted.
+        """
+        # Split and round the same way datetime.fromtimestamp does
+        fraction, whole = math.modf(created)
+        seconds, micros = int(whole), round(fraction * 1e6)
+        if micros >= 1_000_000:
+            seconds, micros = seconds + 1, micros - 1_000_000
+        elif micros < 0:
+            seconds, micros = seconds - 1, micros + 1_000_000
+        
+        cached_second, prefix = self._timestamp_cache
+        if seconds != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+            self._timestamp_cache = (seconds, prefix)
+        
+        return f"{prefix}.{micros:06d}" if micros else prefix
     
     def format(self, record: logging.LogRecord) -> str:
+        timestamp = self._format_timestamp(record.created)
+        message = record.getMessage()
+        
+        # Collect extra fields if configured
+        extras = {
+            key: value for key, value in record.__dict__.items()
+            if key not in _STANDARD_RECORD_ATTRS
+        } if self.include_extra and not record.__dict__.get('_redacted') else {}
+        
+        if orjson is None and _ENTRY_FIELDS.isdisjoint(extras):
+            # Templating the fixed fields beats encoding a dict with the
+            # stdlib encoder and gives the same output. Extras replacing a
+            # fixed field take the dict path below so keys stay unique.
+            parts = [_ENTRY_TEMPLATE % (
+                timestamp,
+                _json_field(record.levelname),
+                _json_field(record.name),
+                _json_str(message),
+                _json_field(record.module),
+                _json_field(record.funcName),
+                _json_field(record.lineno),
+            )]
+            if record.exc_info:
+                exception = self.formatException(record.exc_info)
+                parts.append(', "exception": ' + _json_str(exception))
+            if extras:
+                parts.append(', ' + _dumps(extras)[1:-1])
+            parts.append('}')
+            return ''.join(parts)
+        
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": timestamp,
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": message,
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
@@ -38,18 +170,11 @@ class StructuredFormatter(logging.Formatter):
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
         
-        # Add extra fields if configured
-        if self.include_extra:
-            for key, value in record.__dict__.items():
-                if key not in {
-                    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                    'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
-                    'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                    'thread', 'threadName', 'processName', 'process', 'message'
-                }:
-                    log_entry[key] = value
+        # Merged in one step, so the entry is resized at most once
+        if extras:
+            log_entry.update(extras)
         
-        return json.dumps(log_entry, default=str)
+        return _dumps(log_entry)
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -60,6 +185,42 @@ class ConsoleFormatter(logging.Formatter):
             fmt='%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s',
             datefmt='%H:%M:%S'
         )
+        # (second, formatted clock time) of the last record formatted
+        self._time_cache = (None, '')
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record as ``fmt`` would, without the generic machinery.
+        
+        The layout is fixed, so it is written directly instead of going
+        through %-style substitution, and the clock time is only formatted
+        once per second.
+        """
+        record.message = record.getMessage()
+        
+        seconds = int(record.created)
+        cached_second, clock = self._time_cache
+        if seconds != cached_second:
+            clock = time.strftime(self.datefmt, self.converter(seconds))
+            self._time_cache = (seconds, clock)
+        
+        s = f"{clock} | {record.levelname:<8} | {record.name:<20} | {record.message}"
+        
+        # Exception and stack output as in logging.Formatter.format
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + self.formatStack(record.stack_info)
+        return s
+
+
+# Replacement message for records carrying sensitive information
+_REDACTED = sys.intern("[REDACTED - Sensitive information filtered]")
 
 
 class SecurityFilter(logging.Filter):
@@ -70,21 +231,238 @@ class SecurityFilter(logging.Filter):
         'api_key', 'access_token', 'refresh_token', 'bearer'
     }
     
+    def __init__(self, name: str = ''):
+        super().__init__(name)
+        # One case-insensitive scan instead of lowercasing and testing each field
+        self._pattern = re.compile(
+            '|'.join(map(re.escape, sorted(self.SENSITIVE_FIELDS))),
+            re.IGNORECASE,
+        )
+    
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter out log records that might contain sensitive data."""
-        message = record.getMessage().lower()
+        # The same filter instance is shared by several handlers; each record
+        # only needs scanning by it once
+        if record.__dict__.get('_security_filter') is self:
+            return True
+        record._security_filter = self
         
-        # Check if any sensitive field names appear in the message
-        for sensitive in self.SENSITIVE_FIELDS:
-            if sensitive in message:
-                # Replace with sanitized version
-                record.msg = "[REDACTED - Sensitive information filtered]"
-                record.args = ()
-                break
+        # Check the raw template first: a match there redacts without ever
+        # %-formatting, and without args it is the whole message anyway
+        msg = record.msg if isinstance(record.msg, str) else str(record.msg)
+        if self._pattern.search(msg) or (
+            record.args and self._pattern.search(record.getMessage())
+        ):
+            # Replace with sanitized version; formatters also drop the
+            # extras of flagged records, which may hold the same data
+            record.msg = _REDACTED
+            record.args = None
+            record.message = _REDACTED
+            record._redacted = True
         
         return True
 
 
+def _stream_fd(stream) -> Optional[int]:
+    """Return the OS-level descriptor behind ``stream``, or None if it has none."""
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    return fd if fd >= 0 else None
+
+
+class _FdStreamHandler(logging.StreamHandler):
+    """Stream handler that writes encoded records to the stream's descriptor.
+    
+    This skips the text stream's own locking and encoding layers per record.
+    Streams without a usable descriptor (such as Textual's or pytest's output
+    capture) and Windows consoles are written to normally.
+    """
+    
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._fd = self._get_fd(self.stream)
+    
+    def setStream(self, stream):
+        result = super().setStream(stream)
+        self._fd = self._get_fd(self.stream)
+        return result
+    
+    @staticmethod
+    def _get_fd(stream) -> Optional[int]:
+        if os.name == 'nt':
+            return None
+        return _stream_fd(stream)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._fd is None:
+            super().emit(record)
+            return
+        
+        try:
+            msg = self.format(record) + self.terminator
+            data = msg.encode(getattr(self.stream, 'encoding', None) or 'utf-8', 'replace')
+            # Anything still buffered in the text stream goes out first
+            self.stream.flush()
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view):]
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class SamplingFilter(logging.Filter):
+    """Sample high-frequency records once they exceed a rate, using a token bucket.
+    
+    Each logger name and level gets its own bucket holding up to
+    ``max(rate, 1)`` records and refilling at ``rate`` records per second.
+    While it is empty only every ``sample_every``-th record is kept, so bursts
+    stay visible at reduced volume. WARNING and above always pass.
+    """
+    
+    def __init__(self, rate: float = 1000.0, sample_every: int = 100):
+        super().__init__()
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be at least 1, got {sample_every}")
+        self.rate = rate
+        self.sample_every = sample_every
+        self.dropped = 0
+        # Fractional rates still need room for one whole record
+        self._capacity = max(rate, 1.0)
+        # (logger name, level) -> (tokens left, time of last refill, records over the rate)
+        self._buckets: Dict[Tuple[str, int], Tuple[float, float, int]] = {}
+        self._lock = threading.Lock()
+        self._clock = time.monotonic
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Keep the record if its bucket has a token, else keep 1 in ``sample_every``."""
+        if record.levelno >= logging.WARNING:
+            return True
+        
+        key = (record.name, record.levelno)
+        now = self._clock()
+        with self._lock:
+            tokens, last, over = self._buckets.get(key, (self._capacity, now, 0))
+            tokens = min(self._capacity, tokens + (now - last) * self.rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now, over)
+                return True
+            over += 1
+            self._buckets[key] = (tokens, now, over)
+            if over % self.sample_every == 0:
+                return True
+            self.dropped += 1
+        return False
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that buffers writes instead of flushing per record.
+    
+    Records at ERROR and above are flushed immediately; everything else is
+    flushed every ``flush_interval`` seconds by a background thread and on
+    close. The file size is tracked in memory, as checking it on the stream
+    would flush the buffer on every record.
+    """
+    
+    buffer_size = 64 * 1024
+    
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        mode: str = 'a',
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: Optional[str] = None,
+        delay: bool = False,
+        errors: Optional[str] = None,
+        flush_interval: float = 0.5,
+    ):
+        self._size = 0
+        self._rotatable = True
+        super().__init__(
+            filename, mode, maxBytes, backupCount, encoding, delay, errors
+        )
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name="tokentracktui-log-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+    
+    def _open(self):
+        # FileHandler only keeps a reference to open() from Python 3.10
+        open_func = getattr(self, '_builtin_open', open)
+        stream = open_func(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors
+        )
+        # Only regular files are rotated (bpo-45401); stat once per open
+        stat_result = os.fstat(stream.fileno())
+        self._rotatable = stat.S_ISREG(stat_result.st_mode)
+        self._size = stat_result.st_size
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            # Formatted once, for both the size check and the write
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # maxBytes counts bytes, so only ASCII text can use len() directly
+            size = len(msg) if msg.isascii() else len(
+                msg.encode(self.stream.encoding, self.errors or 'strict')
+            )
+            if (
+                self.maxBytes > 0 and self._rotatable and self._size
+                and self._size + size >= self.maxBytes
+            ):
+                self.doRollover()
+                self._size = 0
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._closing.wait(interval):
+            self.flush()
+    
+    def close(self) -> None:
+        self._closing.set()
+        super().close()
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves records intact for the listener's formatters."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats the record and drops exc_info; the file
+        # formatter needs both separately, and the queue never leaves the
+        # process. Only the message is baked, since args may change later.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+# Listener feeding the queued handlers, replaced on each setup_logging call
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[Path] = None,
@@ -93,7 +471,8 @@ def setup_logging(
     enable_textual_logging: bool = True,
     structured_file_logs: bool = True,
     max_file_size: int = 10 * 1024 * 1024,  # 10MB
-    backup_count: int = 5
+    backup_count: int = 5,
+    metrics_rate_limit: Optional[float] = 1000.0
 ) -> None:
     """
     Set up comprehensive logging for TokenTrackTUI.
@@ -104,12 +483,18 @@ def setup_logging(
         enable_file_logging: Whether to log to file
         enable_console_logging: Whether to log to console
         enable_textual_logging: Whether to enable Textual's logging handler
+            (only added when stdout is a terminal)
         structured_file_logs: Whether to use JSON format for file logs
         max_file_size: Maximum log file size before rotation
         backup_count: Number of backup log files to keep
+        metrics_rate_limit: Records per second kept for each level below
+            WARNING on the performance and API loggers, above which only 1 in
+            ``SamplingFilter.sample_every`` is kept; must be positive, and
+            None disables sampling
     """
     
-    # Clear any existing handlers
+    # Clear any existing handlers, draining records queued for the old ones
+    _stop_queue_listener()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
     
@@ -120,13 +505,22 @@ def setup_logging(
     # Security filter to prevent credential leakage
     security_filter = SecurityFilter()
     
+    # Console and file output are written by a background listener thread,
+    # except a console without a real descriptor
+    queued_handlers = []
+    
     # Console logging
     if enable_console_logging:
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = _FdStreamHandler(sys.stdout)
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(ConsoleFormatter())
-        console_handler.addFilter(security_filter)
-        root_logger.addHandler(console_handler)
+        if _stream_fd(sys.stdout) is not None:
+            queued_handlers.append(console_handler)
+        else:
+            # No real descriptor, e.g. Textual's stdout capture inside the
+            # TUI: its writes must stay on the calling (app) thread
+            console_handler.addFilter(security_filter)
+            root_logger.addHandler(console_handler)
     
     # File logging
     if enable_file_logging:
@@ -137,7 +531,7 @@ def setup_logging(
             log_file = log_dir / 'tokentracktui.log'
         
         # Use rotating file handler to prevent huge log files
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             log_file,
             maxBytes=max_file_size,
             backupCount=backup_count,
@@ -156,12 +550,29 @@ def setup_logging(
                 )
             )
         
-        file_handler.addFilter(security_filter)
-        root_logger.addHandler(file_handler)
+        queued_handlers.append(file_handler)
+    
+    if queued_handlers:
+        # Callers only enqueue; filtering happens once, before the queue
+        log_queue = queue.SimpleQueue()
+        queue_handler = _RecordQueueHandler(log_queue)
+        queue_handler.addFilter(security_filter)
+        root_logger.addHandler(queue_handler)
+        
+        global _queue_listener
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *queued_handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
     
-    # Textual logging integration
-    if enable_textual_logging:
+    # Textual logging integration (kept synchronous, as it needs the
+    # active app of the calling context). Without a terminal there is no
+    # UI to log to; a running app's stdout capture reports as one.
+    if enable_textual_logging and _stdout_is_terminal():
         try:
+            # Imported here so non-TUI users of this module skip Textual
+            from textual.logging import TextualHandler
+            
             textual_handler = TextualHandler()
             textual_handler.setLevel(numeric_level)
             textual_handler.addFilter(security_filter)
@@ -172,12 +583,37 @@ def setup_logging(
     
     # Configure specific loggers
     _configure_specific_loggers(numeric_level)
+    _configure_metrics_sampling(metrics_rate_limit)
     
     # Log the setup completion
     logger = logging.getLogger(__name__)
     logger.info(f"Logging initialized - Level: {level}, File: {log_file}")
 
 
+def _stdout_is_terminal() -> bool:
+    """Check whether stdout is attached to a terminal."""
+    try:
+        return sys.stdout is not None and sys.stdout.isatty()
+    except ValueError:  # Closed stream
+        return False
+
+
+def _stop_queue_listener() -> None:
+    """Stop the background log listener, writing out queued records."""
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    
+    listener, _queue_listener = _queue_listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+# Runs before logging's own shutdown hook, which was registered earlier
+atexit.register(_stop_queue_listener)
+
+
 def _configure_specific_loggers(level: int) -> None:
     """Configure logging levels for specific modules."""
     
@@ -194,6 +630,15 @@ def _configure_specific_loggers(level: int) -> None:
     logging.getLogger('rich').setLevel(logging.WARNING)
 
 
+def _configure_metrics_sampling(rate: Optional[float]) -> None:
+    """Replace the sampling filters on the performance and API loggers."""
+    for logger in (_PERF_LOGGER, _API_LOGGER):
+        for existing in [f for f in logger.filters if isinstance(f, SamplingFilter)]:
+            logger.removeFilter(existing)
+        if rate is not None:
+            logger.addFilter(SamplingFilter(rate))
+
+
 def get_logger(name: str, extra_context: Optional[Dict[str, Any]] = None) -> logging.Logger:
     """
     Get a logger with optional extra context.
@@ -208,15 +653,20 @@ def get_logger(name: str, extra_context: Optional[Dict[str, Any]] = None) -> log
     logger = logging.getLogger(name)
     
     if extra_context:
-        logger = logging.LoggerAdapter(logger, extra_context)
+        # The adapter hands this mapping to every record as-is, so bind a
+        # read-only snapshot rather than the caller's (mutable) dict
+        logger = logging.LoggerAdapter(logger, MappingProxyType(dict(extra_context)))
     
     return logger
 
 
 def log_performance(func_name: str, duration: float, **kwargs) -> None:
     """Log performance metrics."""
-    logger = get_logger('tokentracktui.performance')
-    logger.info(
+    # Skip building the message and extras when INFO is filtered out
+    if not _PERF_LOGGER.isEnabledFor(logging.INFO):
+        return
+    
+    _PERF_LOGGER.info(
         f"Performance: {func_name} completed in {duration:.3f}s",
         extra={
             'performance_metric': True,
@@ -227,6 +677,15 @@ def log_performance(func_name: str, duration: float, **kwargs) -> None:
     )
 
 
+# log_api_call messages keyed on (has status code, has duration)
+_API_CALL_MESSAGES = {
+    (False, False): "API Call: {method} {endpoint}",
+    (True, False): "API Call: {method} {endpoint} -> {status}",
+    (False, True): "API Call: {method} {endpoint} ({duration:.3f}s)",
+    (True, True): "API Call: {method} {endpoint} -> {status} ({duration:.3f}s)",
+}
+
+
 def log_api_call(
     provider: str,
     endpoint: str,
@@ -236,15 +695,14 @@ def log_api_call(
     **kwargs
 ) -> None:
     """Log API call information (without sensitive data)."""
-    logger = get_logger('tokentracktui.api')
+    if not _API_LOGGER.isEnabledFor(logging.INFO):
+        return
     
-    message = f"API Call: {method} {endpoint}"
-    if status_code:
-        message += f" -> {status_code}"
-    if duration:
-        message += f" ({duration:.3f}s)"
+    message = _API_CALL_MESSAGES[bool(status_code), bool(duration)].format(
+        method=method, endpoint=endpoint, status=status_code, duration=duration
+    )
     
-    logger.info(
+    _API_LOGGER.info(
         message,
         extra={
             'api_call': True,